@@ -75,9 +75,13 @@ from .types import (
 
 from .contents import Content
 
-from .utils import next_control
+from .utils import index_controls, next_control
 
-from .exceptions import RossaException, ControlNotFoundException
+from .exceptions import (
+    RossaException,
+    ControlNotFoundException,
+    ContentNotFoundException,
+)
 
 
 __all__ = [
@@ -147,10 +151,12 @@ __all__ = [
     "Content",
     "ContentElement",
     # Utils
+    "index_controls",
     "next_control",
     # Exceptions
     "RossaException",
     "ControlNotFoundException",
+    "ContentNotFoundException",
     # Fields Conditionals
     "IfValue",
     "IfNotValue",
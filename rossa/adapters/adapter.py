@@ -1,8 +1,41 @@
+import inspect
+import os
 from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple
+from weakref import WeakKeyDictionary
 
 from ..workflow_blueprint import WorkflowBlueprint
 
 
+# Source file path per workflow class, and file contents per path with the mtime
+# they were read at, so repeated conversions skip the read until the file changes
+_class_source_files: "WeakKeyDictionary[type, str]" = WeakKeyDictionary()
+_source_file_cache: Dict[str, Tuple[int, str]] = {}
+
+
+def get_class_source_file(cls: type) -> str:
+    """Returns the contents of the file defining `cls`, re-reading it only when it changes."""
+    path = _class_source_files.get(cls)
+
+    if path is None:
+        path = inspect.getsourcefile(cls)
+        _class_source_files[cls] = path
+
+    mtime_ns = os.stat(path).st_mtime_ns
+    cached = _source_file_cache.get(path)
+
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    # A single binary read + decode avoids text mode's incremental decoding
+    with open(path, "rb") as f:
+        source = f.read().decode("utf-8")
+
+    _source_file_cache[path] = (mtime_ns, source)
+
+    return source
+
+
 class AbstractWorkflowAdapter(ABC):
     @abstractmethod
     def convert_workflow(
@@ -10,3 +43,17 @@ class AbstractWorkflowAdapter(ABC):
         workflow: WorkflowBlueprint,
     ):
         pass
+
+    def get_class_code(
+        self,
+        workflow: WorkflowBlueprint,
+        custom_class_code: Optional[str] = None,
+        include_class_code: bool = True,
+    ) -> str:
+        if include_class_code:
+            if custom_class_code is None:
+                return get_class_source_file(workflow.__class__)
+
+            return custom_class_code
+
+        return f"from {workflow.__class__.__module__} import {workflow.__class__.__name__}"
@@ -6,6 +6,23 @@ from .adapter import AbstractWorkflowAdapter
 from ..format_utils import clean_and_format_string
 
 
+GENERATOR_RUN_METHOD = """
+    def run(self, *args, **kwargs):
+        yield from workflow_instance.run(*args, **kwargs)
+"""
+
+RUN_METHOD = """
+    def run(self, *args, **kwargs):
+        result = workflow_instance.run(*args, **kwargs)
+
+        if inspect.isgenerator(result):
+            for x in result:
+                yield x
+        else:
+            yield result
+"""
+
+
 class LocalWorkflowAdapter(AbstractWorkflowAdapter):
     def convert_workflow(
         self,
@@ -13,32 +30,21 @@ class LocalWorkflowAdapter(AbstractWorkflowAdapter):
         custom_class_code: Optional[str] = None,
         include_class_code: bool = True,
     ) -> str:
-        class_code = ""
-
-        if include_class_code:
-            if custom_class_code is None:
-                with open(inspect.getsourcefile(workflow.__class__), "r") as f:
-                    class_code = f.read()
-            else:
-                class_code = custom_class_code
-        else:
-            class_code = f"from {workflow.__class__.__module__} import {workflow.__class__.__name__}"
+        class_code = self.get_class_code(
+            workflow, custom_class_code, include_class_code
+        )
 
         imports = f"""
 import inspect
 
 workflow_instance = {workflow.__class__.__name__}()\n"""
 
-        run_method = """
-    def run(self, *args, **kwargs):
-        result = workflow_instance.run(*args, **kwargs)
-
-        if inspect.isgenerator(result):
-            for x in result:
-                yield x
-        else:
-            yield result
-"""
+        # Known at codegen time, so the generated method skips the runtime check
+        run_method = (
+            GENERATOR_RUN_METHOD
+            if inspect.isgeneratorfunction(type(workflow).original_run)
+            else RUN_METHOD
+        )
 
         local_examples = ""
 
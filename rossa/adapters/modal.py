@@ -1,6 +1,11 @@
+import getpass
+import hashlib
+import inspect
 import json
+import os
+import string
+import tempfile
 from typing import Any, Dict, Union, Optional
-import inspect
 
 
 from .adapter import AbstractWorkflowAdapter
@@ -9,6 +14,138 @@ from ..workflow_blueprint import WorkflowBlueprint
 from ..format_utils import clean_and_format_string
 
 
+# Compiled once at import; convert_workflow only fills in the placeholders
+IMAGE_IMPORTS_TEMPLATE = string.Template(
+    """
+import modal
+import inspect
+
+modal_image = modal.Image.from_dockerfile(
+    $dockerfile_path, 
+    force_build=$force_build
+)
+    
+app = modal.App($modal_app_name)
+
+workflow_instance = $class_name()
+"""
+)
+
+IMPORTS_TEMPLATE = string.Template(
+    """
+import modal
+import inspect
+
+workflow_instance = $class_name()
+"""
+)
+
+LOCAL_EXAMPLES_TEMPLATE = string.Template(
+    """
+import os
+import uuid
+from rossa import Response, Notification
+import tempfile
+
+@app.local_entrypoint()
+def run_modal_workflow():
+    examples = $examples
+    
+    folder = tempfile.mkdtemp()
+    
+    for example in examples:
+        folder_path = os.path.join(folder, example["title"])
+        os.makedirs(folder_path, exist_ok=True)
+        
+        results = ModalWorkflow.run.remote_gen(**example["data"])
+
+        for result in results:
+            if isinstance(result, Response):
+                file_name = uuid.uuid4().hex
+                path = os.path.join(folder_path, file_name)
+                path = os.path.abspath(path)
+                result.save(path)
+                print("Saved (" + result.type + "): " + path)
+            elif isinstance(result, Notification):
+                print(result.dict())
+
+"""
+)
+
+DEPLOYMENT_TEMPLATE = string.Template(
+    """$class_code
+$imports
+
+@app.cls(
+    $app_args
+)
+class ModalWorkflow:
+$download_method
+$load_method
+$run_method
+$local_examples
+"""
+)
+
+
+DOWNLOAD_METHOD = """
+    @modal.build()
+    def download(self):
+        return workflow_instance.download()
+"""
+
+LOAD_METHOD = """
+    @modal.enter()
+    def load(self):
+        return workflow_instance.load()
+"""
+
+GENERATOR_RUN_METHOD = """
+    @modal.method(is_generator=True)
+    def run(self, *args, **kwargs):
+        yield from workflow_instance.run(*args, **kwargs)
+"""
+
+RUN_METHOD = """
+    @modal.method(is_generator=True)
+    def run(self, *args, **kwargs):
+        result = workflow_instance.run(*args, **kwargs)
+
+        if inspect.isgenerator(result):
+            for x in result:
+                yield x
+        else:
+            yield result
+"""
+
+
+def get_dockerfile_cache_dir() -> str:
+    """Returns a per-user directory for generated Dockerfiles that only the current
+    user can write to, or a fresh private directory if that can't be guaranteed."""
+    # Keyed on the uid where there is one: getuser() fails for uids without a
+    # passwd entry, which is common in containers and CI
+    user_id = os.getuid() if hasattr(os, "getuid") else getpass.getuser()
+    cache_dir = os.path.join(tempfile.gettempdir(), f"rossa-{user_id}")
+    os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+
+    if hasattr(os, "getuid"):
+        # lstat, so a symlink planted by another user isn't followed
+        stat = os.lstat(cache_dir)
+
+        if stat.st_uid != os.getuid() or stat.st_mode & 0o077:
+            return tempfile.mkdtemp(prefix="rossa-")
+
+    return cache_dir
+
+
+def is_same_file_content(path: str, content: str) -> bool:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read() == content
+    except OSError:
+        return False
+
+
 class ModalWorkflowAdapter(AbstractWorkflowAdapter):
     def convert_workflow(
         self,
@@ -69,85 +206,71 @@ class ModalWorkflowAdapter(AbstractWorkflowAdapter):
             dockerfile_content = workflow.image.to_dockerfile()
 
             if not return_code_and_dockerfile:
-                import tempfile
-
-                dockerfile_path = tempfile.mktemp()
-                with open(dockerfile_path, "w") as f:
-                    f.write(dockerfile_content)
-
-        class_code = ""
-
-        if include_class_code:
-            if custom_class_code is None:
-                with open(inspect.getsourcefile(workflow.__class__), "r") as f:
-                    class_code = f.read()
-            else:
-                class_code = custom_class_code
-        else:
-            class_code = f"from {workflow.__class__.__module__} import {workflow.__class__.__name__}"
+                # Same Dockerfile, same path: repeated deploys reuse the file
+                dockerfile_hash = hashlib.sha256(
+                    dockerfile_content.encode("utf-8")
+                ).hexdigest()
+                dockerfile_path = os.path.join(
+                    get_dockerfile_cache_dir(), f"rossa-{dockerfile_hash}.Dockerfile"
+                )
+
+                # Only reuse a cached file that holds exactly this Dockerfile
+                if not is_same_file_content(dockerfile_path, dockerfile_content):
+                    # Write to a unique temp file and rename it into place, so a
+                    # concurrent deploy never sees a partially written Dockerfile
+                    with tempfile.NamedTemporaryFile(
+                        "w",
+                        encoding="utf-8",
+                        dir=os.path.dirname(dockerfile_path),
+                        suffix=".Dockerfile",
+                        delete=False,
+                    ) as f:
+                        f.write(dockerfile_content)
+
+                    os.replace(f.name, dockerfile_path)
+
+        class_code = self.get_class_code(
+            workflow, custom_class_code, include_class_code
+        )
 
-        is_same_download_method = inspect.getsource(
-            workflow.download
-        ) == inspect.getsource(WorkflowBlueprint.download)
-        is_same_load_method = inspect.getsource(workflow.load) == inspect.getsource(
-            WorkflowBlueprint.load
+        # Class attribute lookup returns the plain function, so identity tells us
+        # whether the workflow overrides the blueprint's no-op hooks
+        is_same_download_method = (
+            type(workflow).download is WorkflowBlueprint.download
         )
+        is_same_load_method = type(workflow).load is WorkflowBlueprint.load
 
         if isinstance(workflow.image, Image):
-            imports = f"""
-import modal
-import inspect
-
-modal_image = modal.Image.from_dockerfile(
-    {dockerfile_path!r}, 
-    force_build={force_build}
-)
-    
-app = modal.App({modal_app_name!r})
-
-workflow_instance = {workflow.__class__.__name__}()\n"""
+            imports = IMAGE_IMPORTS_TEMPLATE.substitute(
+                dockerfile_path=repr(dockerfile_path),
+                force_build=force_build,
+                modal_app_name=repr(modal_app_name),
+                class_name=workflow.__class__.__name__,
+            )
         else:
-            imports = f"""
-import modal
-import inspect
-
-workflow_instance = {workflow.__class__.__name__}()\n"""
-
-        download_method = ""
-
-        app_args = "image=modal_image" if workflow.image else ""
+            imports = IMPORTS_TEMPLATE.substitute(
+                class_name=workflow.__class__.__name__
+            )
 
-        if workflow.image and modal_app_args:
-            app_args += ",\n"
+        app_args_parts = []
 
-        app_args += modal_app_args if modal_app_args else ""
+        if workflow.image:
+            app_args_parts.append("image=modal_image")
 
-        if not is_same_download_method:
-            download_method = """
-    @modal.build()
-    def download(self):
-        return workflow_instance.download()
-"""
+        if modal_app_args:
+            app_args_parts.append(modal_app_args)
 
-        load_method = ""
-        if not is_same_load_method:
-            load_method = """
-    @modal.enter()
-    def load(self):
-        return workflow_instance.load()
-"""
+        app_args = ",\n".join(app_args_parts)
 
-        run_method = """
-    @modal.method(is_generator=True)
-    def run(self, *args, **kwargs):
-        result = workflow_instance.run(*args, **kwargs)
+        download_method = "" if is_same_download_method else DOWNLOAD_METHOD
+        load_method = "" if is_same_load_method else LOAD_METHOD
 
-        if inspect.isgenerator(result):
-            for x in result:
-                yield x
-        else:
-            yield result
-"""
+        # Known at codegen time, so the generated method skips the runtime check
+        run_method = (
+            GENERATOR_RUN_METHOD
+            if inspect.isgeneratorfunction(type(workflow).original_run)
+            else RUN_METHOD
+        )
 
         local_examples = ""
 
@@ -160,48 +283,19 @@ workflow_instance = {workflow.__class__.__name__}()\n"""
                 for example in workflow.examples
             ]
 
-            local_examples = f"""
-import os
-import uuid
-from rossa import Response, Notification
-import tempfile
-
-@app.local_entrypoint()
-def run_modal_workflow():
-    examples = {json.loads(json.dumps(formatted_examples))}
-    
-    folder = tempfile.mkdtemp()
-    
-    for example in examples:
-        folder_path = os.path.join(folder, example["title"])
-        os.makedirs(folder_path, exist_ok=True)
-        
-        results = ModalWorkflow.run.remote_gen(**example["data"])
-
-        for result in results:
-            if isinstance(result, Response):
-                file_name = uuid.uuid4().hex
-                path = os.path.join(folder_path, file_name)
-                path = os.path.abspath(path)
-                result.save(path)
-                print("Saved (" + result.type + "): " + path)
-            elif isinstance(result, Notification):
-                print(result.dict())
-
-"""
-
-        deployment_code = f"""{class_code}
-{imports}
+            local_examples = LOCAL_EXAMPLES_TEMPLATE.substitute(
+                examples=json.loads(json.dumps(formatted_examples))
+            )
 
-@app.cls(
-    {app_args}
-)
-class ModalWorkflow:
-{download_method}
-{load_method}
-{run_method}
-{local_examples}
-"""
+        deployment_code = DEPLOYMENT_TEMPLATE.substitute(
+            class_code=class_code,
+            imports=imports,
+            app_args=app_args,
+            download_method=download_method,
+            load_method=load_method,
+            run_method=run_method,
+            local_examples=local_examples,
+        )
 
         if return_code_and_dockerfile:
             return {
@@ -0,0 +1,38 @@
+import base64
+import binascii
+from typing import Tuple
+
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
+
+def b64encode_to_str(data) -> str:
+    """Base64-encodes any bytes-like object (bytes, memoryview, ...) to an ASCII str."""
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(data)
+
+    return base64.b64encode(data).decode("ascii")
+
+
+def b64decode(data) -> bytes:
+    """Decodes base64 from a str or bytes-like object without a strict validation pass."""
+    if pybase64 is not None:
+        return pybase64.b64decode(data, validate=False)
+
+    # a2b_base64 accepts ASCII str directly, skipping base64.b64decode's re-encode
+    return binascii.a2b_base64(data)
+
+
+def parse_data_url(url: str) -> Tuple[str, bytes]:
+    """Returns the media type and the decoded payload of a base64 data URL."""
+    comma = url.find(",")
+
+    if comma < 0:
+        raise ValueError("Invalid data URL. Missing ',' before the payload.")
+
+    semicolon = url.find(";", 0, comma)
+    media_type = url[len("data:") : semicolon if semicolon >= 0 else comma]
+
+    return media_type, b64decode(url[comma + 1 :])
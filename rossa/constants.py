@@ -7,6 +7,19 @@ DEFAULT_IMAGE_FORMAT = "PNG"
 
 DEFAULT_IMAGE_MIME_TYPE = "image/png"
 
+RAW_IMAGE_FORMAT = "RAW"
+
+RAW_IMAGE_MIME_TYPE = "application/octet-stream"
+
+IMAGE_FORMAT_MIME_TYPES = {
+    "PNG": "image/png",
+    "JPG": "image/jpeg",
+    "JPEG": "image/jpeg",
+    "WEBP": "image/webp",
+    "GIF": "image/gif",
+    "BMP": "image/bmp",
+}
+
 PROMPT_FIELD_ALIAS = "prompt"
 
 NEGATIVE_PROMPT_FIELD_ALIAS = "negative_prompt"
@@ -1,118 +1,333 @@
-import base64
-import io
+import asyncio
 import mimetypes
 import os
-from typing import Any, Dict, Union, Optional
-import requests
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple, Union, Optional
 from fastapi import Response as FastAPIResponse
+from fastapi.responses import FileResponse
 
-from .field_values import FieldValue
-from .reserved_field_values import ReservedFieldValue
+from .field_values import FieldValue, get_settings_model
 
-from pydantic import BaseModel, create_model, validator
+from pydantic import BaseModel, PrivateAttr, validator
 from .types import ContentType
-from .image_conversion_utils import url_to_cv2_image, url_to_pil_image
+from .image_conversion_utils import (
+    bytes_to_cv2_image,
+    encode_image,
+    image_format_mime_type,
+    url_to_cv2_image,
+    url_to_pil_image,
+)
+from .base64_utils import b64encode_to_str, parse_data_url
+from .json_utils import json_dumps, json_loads
+from .http_utils import download_to_file, http_get
 from .constants import (
     DEFAULT_IMAGE_FORMAT,
     DEFAULT_IMAGE_MIME_TYPE,
+    IMAGE_FORMAT_MIME_TYPES,
+    RAW_IMAGE_FORMAT,
+    RAW_IMAGE_MIME_TYPE,
 )
 from PIL import Image
 import numpy as np
 
 
+DEFAULT_SAVE_WORKERS = 16
+
+# Shared by the async helpers; threads are only started on first submit.
+ENCODE_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+
+# Load the system mime database at import time rather than on the first request.
+mimetypes.init()
+
+# Derived from the format table so the two can't drift apart
+_EXTENSION_MEDIA_TYPES = {
+    f".{format.lower()}": mime_type
+    for format, mime_type in IMAGE_FORMAT_MIME_TYPES.items()
+}
+
+
+@lru_cache(maxsize=64)
+def _guess_extension_media_type(extension: str) -> Optional[str]:
+    media_type, _ = mimetypes.guess_type(f"file{extension}")
+    return media_type
+
+
+def guess_media_type(path: str) -> Optional[str]:
+    """Guesses the media type of a file path, caching the lookup per extension."""
+    extension = os.path.splitext(path)[1].lower()
+    media_type = _EXTENSION_MEDIA_TYPES.get(extension)
+
+    if media_type is None:
+        media_type = _guess_extension_media_type(extension)
+
+    return media_type
+
+
+DATA_URL_PREFIX = "data:"
+
+IMAGE_KIND = "image"
+BYTES_KIND = "bytes"
+URL_KIND = "url"
+DATA_URL_KIND = "data_url"
+FILE_KIND = "file"
+TEXT_KIND = "text"
+
+
+def content_kind(content: Union[str, bytes, Image.Image, np.ndarray]) -> str:
+    """Classifies a content value once so callers can dispatch on the result."""
+    if isinstance(content, (Image.Image, np.ndarray)):
+        return IMAGE_KIND
+    elif isinstance(content, bytes):
+        return BYTES_KIND
+
+    # One short slice compared against constants is cheaper than startswith calls.
+    head = content[:8]
+
+    if head == "https://" or head[:7] == "http://":
+        return URL_KIND
+    elif head[:5] == DATA_URL_PREFIX:
+        return DATA_URL_KIND
+    elif os.path.isfile(content):
+        return FILE_KIND
+
+    return TEXT_KIND
+
+
+def save_image(content: Union[Image.Image, np.ndarray], file_path: str):
+    img = content if isinstance(content, Image.Image) else Image.fromarray(content)
+
+    try:
+        img.save(file_path)
+    except Exception as e:
+        if "unknown file extension" in str(e):
+            img.save(file_path, format=DEFAULT_IMAGE_FORMAT)
+
+
+def save_bytes(content: bytes, file_path: str):
+    with open(file_path, "wb") as file:
+        file.write(content)
+
+
+def save_url(content: str, file_path: str):
+    with open(file_path, "wb") as file:
+        download_to_file(content, file)
+
+
+def save_data_url(content: str, file_path: str):
+    _, data = parse_data_url(content)
+    save_bytes(data, file_path)
+
+
+def save_file(content: str, file_path: str):
+    # copyfile uses the kernel copy fast paths (sendfile / fcopyfile) and never
+    # loads the whole file into memory.
+    shutil.copyfile(content, file_path)
+
+
+def save_text(content: str, file_path: str):
+    save_bytes(content.encode("utf-8"), file_path)
+
+
+SAVE_HANDLERS = {
+    IMAGE_KIND: save_image,
+    BYTES_KIND: save_bytes,
+    URL_KIND: save_url,
+    DATA_URL_KIND: save_data_url,
+    FILE_KIND: save_file,
+    TEXT_KIND: save_text,
+}
+
+
+def bytes_response(content: bytes):
+    return FastAPIResponse(content=content, media_type="application/octet-stream")
+
+
+def url_response(content: str):
+    response = http_get(content)
+    return FastAPIResponse(
+        content=response.content,
+        media_type=response.headers["Content-Type"],
+    )
+
+
+def data_url_response(content: str):
+    media_type, data = parse_data_url(content)
+    return FastAPIResponse(content=data, media_type=media_type)
+
+
+def file_response(content: str):
+    # isfile() was already checked by content_kind; that stat is not cached, as
+    # files can appear or disappear between calls. FileResponse streams the file in
+    # chunks when the response is sent, so large outputs are never read whole.
+    return FileResponse(content, media_type=guess_media_type(content))
+
+
+def text_response(content: str):
+    return FastAPIResponse(content=content, media_type="text/plain")
+
+
+RESPONSE_HANDLERS = {
+    BYTES_KIND: bytes_response,
+    URL_KIND: url_response,
+    DATA_URL_KIND: data_url_response,
+    FILE_KIND: file_response,
+    TEXT_KIND: text_response,
+}
+
+
 class Content(BaseModel):
     type: ContentType
     content: Union[str, bytes, Image.Image, np.ndarray]
     settings: Dict[str, Any] = {}
 
+    # format -> (content it was encoded from, encoded bytes)
+    _encoded: Dict[str, Tuple[Any, bytes]] = PrivateAttr(default_factory=dict)
+
     @validator("settings", pre=True)
     def validate_settings(cls, v: Dict[str, Any]) -> Dict[str, Any]:
-        SettingsModel = create_model(
-            "SettingsModel",
-            __root__=(
-                Dict[str, Union[FieldValue, ReservedFieldValue]],
-                ...,
-            ),
-        )
+        # Imported here, control values hold contents
+        from .reserved_field_values import ReservedFieldValue
+
+        SettingsModel = get_settings_model(Union[FieldValue, ReservedFieldValue])
 
         SettingsModel(__root__=v)
         return v
 
     class Config:
         arbitrary_types_allowed = True
+        json_dumps = json_dumps
+        json_loads = json_loads
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = super().__getstate__()
+
+        # Contents are pickled to leave the container; the encode cache would only
+        # add the encoded image to the payload, it is rebuilt on demand instead
+        state["__private_attribute_values__"] = {
+            name: value
+            for name, value in state["__private_attribute_values__"].items()
+            if name != "_encoded"
+        }
+
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        super().__setstate__(state)
+        object.__setattr__(self, "_encoded", {})
 
     def get_setting(self, key: str, default: Optional[Any] = None) -> Any:
         return self.settings.get(key, default)
 
+    def encode_image(self, format: str = DEFAULT_IMAGE_FORMAT) -> bytes:
+        """Encodes the image content, reusing the previous result for the same format.
+
+        The cache is dropped when `content` is reassigned; mutating an array in place
+        is not detected.
+        """
+        content = self.content
+        format = format.upper()
+        cached = self._encoded.get(format)
+
+        if cached is not None and cached[0] is content:
+            return cached[1]
+
+        image = (
+            content
+            if isinstance(content, (Image.Image, np.ndarray))
+            else self.to_pil_image()
+        )
+        content_data = encode_image(image, format)
+        self._encoded[format] = (content, content_data)
+        return content_data
+
     def to_response(self):
         content = self.content
+        kind = content_kind(content)
 
-        if isinstance(content, (Image.Image, np.ndarray)):
-            buffered = io.BytesIO()
-            if isinstance(content, Image.Image):
-                content.save(buffered, format=DEFAULT_IMAGE_FORMAT)
-            else:
-                Image.fromarray(content).save(buffered, format=DEFAULT_IMAGE_FORMAT)
-            content_data = buffered.getvalue()
+        # Images go through the per-format encode cache, which lives on the model
+        if kind == IMAGE_KIND:
+            content_data = self.encode_image(DEFAULT_IMAGE_FORMAT)
             return FastAPIResponse(
                 content=content_data,
                 media_type=DEFAULT_IMAGE_MIME_TYPE,
             )
-        elif isinstance(content, str):
-            if content.startswith(("http://", "https://")):
-                response = requests.get(content)
-                return FastAPIResponse(
-                    content=response.content,
-                    media_type=response.headers["Content-Type"],
-                )
-            elif content.startswith("data:"):
-                header, encoded = content.split(",", 1)
-                media_type = header.split(":")[1].split(";")[0]
-                content = base64.b64decode(encoded)
-                return FastAPIResponse(content=content, media_type=media_type)
-            elif os.path.isfile(content):
-                with open(content, "rb") as file:
-                    content_data = file.read()
-                    media_type, _ = mimetypes.guess_type(content)
-                    return FastAPIResponse(content=content_data, media_type=media_type)
-            else:
-                return FastAPIResponse(content=content, media_type="text/plain")
-        elif isinstance(content, bytes):
-            return FastAPIResponse(
-                content=content, media_type="application/octet-stream"
-            )
 
-    def save(self, file_path: str):
+        return RESPONSE_HANDLERS[kind](content)
+
+    async def to_response_async(self):
+        """Runs `to_response` in a worker thread so URL downloads don't block the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.to_response)
+
+    def to_base64(self, format: str = DEFAULT_IMAGE_FORMAT) -> str:
+        """Encodes the image content as a base64 data URL.
+
+        `format="RAW"` skips image encoding and embeds the pixel buffer as-is, with
+        its shape and dtype in the header, for consumers that only need the array.
+        """
         content = self.content
+        format = format.upper()
 
-        if isinstance(content, (Image.Image, np.ndarray)):
-            img = (
+        if format == RAW_IMAGE_FORMAT:
+            array = (
                 content
-                if isinstance(content, Image.Image)
-                else Image.fromarray(content)
+                if isinstance(content, np.ndarray)
+                else np.asarray(self.to_pil_image())
             )
-            try:
-                img.save(file_path)
-            except Exception as e:
-                if "unknown file extension" in str(e):
-                    img.save(file_path, format=DEFAULT_IMAGE_FORMAT)
-        else:
-            with open(file_path, "wb") as file:
-                if isinstance(content, str):
-                    if content.startswith(("http://", "https://")):
-                        response = requests.get(content)
-                        file.write(response.content)
-                    elif content.startswith("data:"):
-                        header, encoded = content.split(",", 1)
-                        content_data = base64.b64decode(encoded)
-                        file.write(content_data)
-                    elif os.path.isfile(content):
-                        with open(content, "rb") as src_file:
-                            file.write(src_file.read())
-                    else:
-                        file.write(content.encode("utf-8"))
-                elif isinstance(content, bytes):
-                    file.write(content)
+            array = np.ascontiguousarray(array)
+            shape = "x".join(str(dim) for dim in array.shape)
+            encoded = b64encode_to_str(array.data)
+            return f"data:{RAW_IMAGE_MIME_TYPE};shape={shape};dtype={array.dtype};base64,{encoded}"
+
+        media_type = image_format_mime_type(format)
+        content_data = self.encode_image(format)
+        encoded = b64encode_to_str(content_data)
+        return f"data:{media_type};base64,{encoded}"
+
+    async def to_base64_async(self, format: str = DEFAULT_IMAGE_FORMAT) -> str:
+        """Runs `to_base64` in the shared encode pool so the event loop isn't blocked."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(ENCODE_POOL, self.to_base64, format)
+
+    def save(self, file_path: str):
+        content = self.content
+
+        SAVE_HANDLERS[content_kind(content)](content, file_path)
+
+    async def save_async(self, file_path: str):
+        """Runs `save` in a worker thread so URL downloads don't block the event loop."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.save, file_path)
+
+    @classmethod
+    def save_many(
+        cls,
+        contents: List["Content"],
+        file_paths: List[str],
+        max_workers: int = DEFAULT_SAVE_WORKERS,
+    ):
+        """Saves several contents concurrently.
+
+        Downloads share the pooled HTTP session and image encodes release the GIL,
+        so saving N URLs takes roughly the time of the slowest one instead of the sum.
+        """
+        if len(contents) != len(file_paths):
+            raise ValueError("contents and file_paths must have the same length.")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume the iterator so exceptions raised in workers propagate.
+            list(executor.map(lambda c, p: c.save(p), contents, file_paths))
+
+    @classmethod
+    def batch_to_base64(
+        cls, contents: List["Content"], format: str = DEFAULT_IMAGE_FORMAT
+    ) -> List[str]:
+        """Encodes several contents to base64 data URLs in parallel, keeping order."""
+        return list(ENCODE_POOL.map(lambda c: c.to_base64(format), contents))
 
     def to_pil_image(self) -> Image.Image:
         content = self.content
@@ -121,6 +336,8 @@ class Content(BaseModel):
             return content
         elif isinstance(content, np.ndarray):
             return Image.fromarray(content)
+        elif isinstance(content, bytes):
+            return Image.open(BytesIO(content))
         else:
             img = url_to_pil_image(content)
             if img is None:
@@ -134,6 +351,11 @@ class Content(BaseModel):
             return content
         elif isinstance(content, Image.Image):
             return np.array(content)
+        elif isinstance(content, bytes):
+            img = bytes_to_cv2_image(content)
+            if img is None:
+                raise Exception("Invalid image bytes. Please provide a valid image.")
+            return img
         else:
             img = url_to_cv2_image(content)
             if img is None:
@@ -141,7 +363,7 @@ class Content(BaseModel):
             return img
 
     def has_image(self) -> bool:
-        return any(content.type == ContentType.IMAGE for content in self.contents)
+        return self.type == ContentType.IMAGE
 
     def has_mask(self) -> bool:
-        return any(content.type == ContentType.MASK for content in self.contents)
+        return self.type == ContentType.MASK
@@ -4,3 +4,7 @@ class RossaException(Exception):
 
 class ControlNotFoundException(RossaException):
     pass
+
+
+class ContentNotFoundException(RossaException):
+    pass
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, create_model, validator
@@ -15,18 +16,26 @@ FieldValue = Union[
 ]
 
 
+@lru_cache(maxsize=None)
+def get_settings_model(value_type: Any):
+    """Builds the root model validating a settings dict once per value type."""
+    return create_model(
+        "SettingsModel",
+        __root__=(
+            Dict[str, value_type],
+            ...,
+        ),
+    )
+
+
 class OptionValue(BaseModel):
     type: Union[str, List[str]]
     settings: Dict[str, Any] = {}
 
     @validator("settings", pre=True)
     def validate_settings(cls, v: Dict[str, Any]) -> Dict[str, Any]:
-        SettingsModel = create_model(
-            "SettingsModel",
-            __root__=(
-                Dict[str, Union[FieldValue, OptionValue, List[OptionValue]]],
-                ...,
-            ),
+        SettingsModel = get_settings_model(
+            Union[FieldValue, OptionValue, List[OptionValue]]
         )
 
         SettingsModel(__root__=v)
@@ -15,6 +15,20 @@ from .constants import SAFE_DEFAULT_FIELD_KEY
 
 BaseFieldInfo = FieldInfo
 
+# Built once; str-valued enum members hash like their values, so both
+# `FieldType.SELECT` and `"select"` hit these sets. FIELD_TYPES holds the plain
+# strings so a probe compares str to str.
+FIELD_TYPES = frozenset(field_type.value for field_type in FieldType)
+
+OPTIONS_FIELD_TYPES = frozenset(
+    {
+        FieldType.SELECT,
+        FieldType.RADIO,
+        FieldType.DYNAMIC_FORM,
+        FieldType.CONTROLS,
+    }
+)
+
 
 class Option(BaseModel):
     value: str
@@ -57,16 +71,7 @@ def BaseField(
             if not isinstance(option, Option):
                 raise Exception("Field options must be a list of Option.")
 
-    if (
-        type
-        in [
-            FieldType.SELECT,
-            FieldType.RADIO,
-            FieldType.DYNAMIC_FORM,
-            FieldType.CONTROLS,
-        ]
-        and not options
-    ):
+    if type in OPTIONS_FIELD_TYPES and not options:
         raise Exception(
             "Select, Radio, Dynamic Form and Controls fields must have options."
         )
@@ -80,7 +85,7 @@ def BaseField(
         raise Exception("default_generator_type must be a GeneratorType.")
 
     # validate if type is in FieldType
-    if type not in set(FieldType):
+    if type not in FIELD_TYPES:
         raise Exception("Field type must be in FieldType.")
 
     def default_factory():
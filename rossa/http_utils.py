@@ -0,0 +1,54 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import requests
+
+
+DEFAULT_TIMEOUT = 30
+
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+
+
+_session = None
+
+
+def get_session() -> "requests.Session":
+    """Returns the shared pooled session, importing requests and building it on first use.
+
+    A single session lets repeated downloads reuse keep-alive connections instead of
+    paying a new TCP + TLS handshake per request.
+    """
+    global _session
+
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.1),
+        )
+
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        _session = session
+
+    return _session
+
+
+def http_get(
+    url: str, timeout: float = DEFAULT_TIMEOUT, **kwargs
+) -> "requests.Response":
+    return get_session().get(url, timeout=timeout, **kwargs)
+
+
+def download_to_file(url: str, file, timeout: float = DEFAULT_TIMEOUT):
+    """Streams the body of `url` into an open binary file without buffering it whole."""
+    with http_get(url, timeout=timeout, stream=True) as response:
+        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            file.write(chunk)
@@ -927,20 +927,29 @@ class _Image:
 
     def to_dockerfile(self) -> str:
         """Convert the image to a Dockerfile."""
-        docker_file = ""
+        # Specs are only ever appended, so the count identifies the rendered state
+        cached = getattr(self, "_dockerfile_cache", None)
+
+        if cached is not None and cached[0] == len(self.commands):
+            return cached[1]
+
+        lines = []
 
         for spec in self.commands:
             for command in spec.commands:
                 if "pip install -r /modal_requirements.txt" in command:
-                    docker_file += f"RUN apt-get update && apt-get install -y git \n"
-                    docker_file += f"RUN python -m pip install git+https://github.com/rossaai/workflows \n"
+                    lines.append(f"RUN apt-get update && apt-get install -y git \n")
+                    lines.append(f"RUN python -m pip install git+https://github.com/rossaai/workflows \n")
 
                 if "FROM base" in command:
                     continue
                 if "/modal_requirements.txt" in command:
                     continue
-                docker_file += command + "\n"
-            docker_file += "\n"
+                lines.append(command + "\n")
+            lines.append("\n")
+
+        docker_file = "".join(lines)
+        self._dockerfile_cache = (len(self.commands), docker_file)
 
         return docker_file
 
@@ -1,7 +1,49 @@
-import base64
+from functools import lru_cache
 from io import BytesIO
+from typing import Union
 from PIL import Image
-import requests
+import numpy as np
+
+from .constants import DEFAULT_IMAGE_FORMAT, IMAGE_FORMAT_MIME_TYPES
+from .http_utils import http_get
+from .base64_utils import parse_data_url
+
+try:
+    import pyvips
+except ImportError:
+    pyvips = None
+
+try:
+    import turbojpeg
+except ImportError:
+    turbojpeg = None
+
+
+# Fast DEFLATE for encodes on the response path; output is ~10% larger than the
+# default level but compresses several times faster.
+PNG_COMPRESS_LEVEL = 1
+
+JPEG_QUALITY = 90
+
+# Image modes that map 1:1 to a uint8 array libvips can consume directly.
+VIPS_COMPATIBLE_MODES = {"L", "LA", "RGB", "RGBA"}
+
+
+def image_format_mime_type(format: str) -> str:
+    """Returns the MIME type of an image format. Raises for formats without one, so
+    encoded data is never labelled with the wrong type."""
+    format = format.upper()
+    mime_type = IMAGE_FORMAT_MIME_TYPES.get(format)
+
+    if mime_type is None:
+        # Loads every plugin, which registers the MIME types of their formats
+        Image.init()
+        mime_type = Image.MIME.get(format)
+
+    if mime_type is None:
+        raise ValueError(f"Unknown MIME type for image format {format}.")
+
+    return mime_type
 
 
 def url_to_pil_image(url: str):
@@ -9,33 +51,145 @@ def url_to_pil_image(url: str):
         return None
 
     if url.startswith("data:image"):
-        base64_str_index = url.find("base64,") + len("base64,")
-        image_data = base64.b64decode(url[base64_str_index:])
+        _, image_data = parse_data_url(url)
         image = Image.open(BytesIO(image_data))
     else:
         # add 10 seconds timeout
-        response = requests.get(url, timeout=10)
+        response = http_get(url, timeout=10)
         image = Image.open(BytesIO(response.content))
 
     return image
 
 
-def url_to_cv2_image(url: str):
-    """Converts a URL to a cv2 image. Remember to install cv2 and numpy."""
+def bytes_to_cv2_image(data: bytes):
+    """Decodes encoded image bytes straight into a BGR array, without a PIL image."""
     import cv2
-    import numpy as np
 
+    return cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+
+
+def url_to_cv2_image(url: str):
+    """Converts a URL to a cv2 image. Remember to install cv2 and numpy."""
     if not isinstance(url, str):
         return None
 
     if url.startswith("data:image"):
-        base64_str_index = url.find("base64,") + len("base64,")
-        image_data = base64.b64decode(url[base64_str_index:])
-        image = cv2.imdecode(np.frombuffer(image_data, np.uint8), cv2.IMREAD_COLOR)
+        _, image_data = parse_data_url(url)
+        image = bytes_to_cv2_image(image_data)
     else:
-        response = requests.get(url)
-        image = cv2.imdecode(
-            np.frombuffer(response.content, np.uint8), cv2.IMREAD_COLOR
-        )
+        response = http_get(url)
+        image = bytes_to_cv2_image(response.content)
 
     return image
+
+
+def vips_encode_image(array: np.ndarray, format: str):
+    """Encodes a uint8 array with libvips. Returns None if libvips can't handle it."""
+    if array.dtype != np.uint8 or array.ndim not in (2, 3):
+        return None
+
+    bands = 1 if array.ndim == 2 else array.shape[2]
+
+    if bands > 4:
+        return None
+
+    array = np.ascontiguousarray(array)
+    height, width = array.shape[:2]
+
+    image = pyvips.Image.new_from_memory(array.data, width, height, bands, "uchar")
+
+    if format == "PNG":
+        return image.pngsave_buffer(compression=3)
+    elif format == "JPEG" and bands in (1, 3):
+        return image.jpegsave_buffer(Q=JPEG_QUALITY)
+    elif format == "WEBP":
+        return image.webpsave_buffer()
+
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_turbo_jpeg():
+    """Returns the shared TurboJPEG encoder, or None if libturbojpeg is missing. The
+    outcome is cached, so a missing library is only looked up once."""
+    try:
+        return turbojpeg.TurboJPEG()
+    except (RuntimeError, OSError):
+        # The python package is installed but libturbojpeg is not.
+        return None
+
+
+def turbo_encode_image(array: np.ndarray):
+    """Encodes a uint8 RGB or grayscale array with libjpeg-turbo. Returns None if it
+    can't handle the array or the native library is missing."""
+    turbo_jpeg = get_turbo_jpeg()
+
+    if turbo_jpeg is None or array.dtype != np.uint8:
+        return None
+
+    if array.ndim == 2:
+        array = array[:, :, None]
+
+    if array.ndim != 3 or array.shape[2] not in (1, 3):
+        return None
+
+    if array.shape[2] == 1:
+        return turbo_jpeg.encode(
+            np.ascontiguousarray(array),
+            quality=JPEG_QUALITY,
+            pixel_format=turbojpeg.TJPF_GRAY,
+            jpeg_subsample=turbojpeg.TJSAMP_GRAY,
+        )
+
+    return turbo_jpeg.encode(
+        np.ascontiguousarray(array),
+        quality=JPEG_QUALITY,
+        pixel_format=turbojpeg.TJPF_RGB,
+    )
+
+
+def encode_image(
+    image: Union[Image.Image, np.ndarray], format: str = DEFAULT_IMAGE_FORMAT
+) -> bytes:
+    """Encodes a PIL image or a numpy array, using libjpeg-turbo or libvips when installed."""
+    format = format.upper()
+
+    if format == "JPG":
+        format = "JPEG"
+
+    if format == "JPEG" and turbojpeg is not None and get_turbo_jpeg() is not None:
+        if isinstance(image, np.ndarray):
+            content_data = turbo_encode_image(image)
+        elif image.mode in ("L", "RGB"):
+            content_data = turbo_encode_image(np.asarray(image))
+        else:
+            content_data = None
+
+        if content_data is not None:
+            return content_data
+
+    if pyvips is not None:
+        if isinstance(image, np.ndarray):
+            content_data = vips_encode_image(image, format)
+        elif image.mode in VIPS_COMPATIBLE_MODES:
+            content_data = vips_encode_image(np.asarray(image), format)
+        else:
+            content_data = None
+
+        if content_data is not None:
+            return content_data
+
+    if isinstance(image, np.ndarray):
+        # PIL copies non-contiguous arrays internally; do it once up front.
+        image = Image.fromarray(np.ascontiguousarray(image))
+
+    buffered = BytesIO()
+
+    if format == "PNG":
+        image.save(buffered, format=format, compress_level=PNG_COMPRESS_LEVEL)
+    else:
+        image.save(buffered, format=format)
+
+    # bytes rather than a getbuffer() view: results get cached on contents, which
+    # are pickled and deep-copied, and memoryviews can't be
+    return buffered.getvalue()
@@ -0,0 +1,25 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_dumps(value, *, default=None, **kwargs) -> str:
+    """Pydantic `json_dumps` hook, serializing with orjson when it is installed."""
+    # orjson has no equivalent for json.dumps options like indent or sort_keys.
+    if orjson is None or kwargs:
+        return json.dumps(value, default=default, **kwargs)
+
+    return orjson.dumps(
+        value, default=default, option=orjson.OPT_SERIALIZE_NUMPY
+    ).decode("utf-8")
+
+
+def json_loads(value):
+    """Pydantic `json_loads` hook, parsing with orjson when it is installed."""
+    if orjson is None:
+        return json.loads(value)
+
+    return orjson.loads(value)
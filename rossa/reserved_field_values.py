@@ -1,31 +1,43 @@
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import create_model, validator
+from pydantic import validator
+
+from PIL import Image
 
 from .constants import INTENSITY_FIELD_ALIAS, INTENSITY_FIELD_DEFAULT
+from .contents import Content
+from .exceptions import ContentNotFoundException
+from .types import ContentType
 
-from .field_values import FieldValue, OptionValue
+from .field_values import FieldValue, OptionValue, get_settings_model
 
 
 class ControlValue(OptionValue):
     type: str
-    input_contents: List[str] = []
+    input_contents: List[Content] = []
     output_contents: List[str] = []
     settings: Dict[str, Any] = {}
 
     @validator("settings", pre=True)
     def validate_settings(cls, v: Dict[str, Any]) -> Dict[str, Any]:
-        SettingsModel = create_model(
-            "SettingsModel",
-            __root__=(
-                Dict[str, Union[List[ControlValue], FieldValue]],
-                ...,
-            ),
-        )
+        SettingsModel = get_settings_model(Union[List[ControlValue], FieldValue])
 
         SettingsModel(__root__=v)
         return v
 
+    @validator("input_contents", pre=True)
+    def validate_input_contents(cls, v: List[Any]) -> List[Any]:
+        # Bare strings are the original wire format, read them as image contents
+        if not isinstance(v, list):
+            return v
+
+        return [
+            Content(type=ContentType.IMAGE, content=content)
+            if isinstance(content, str)
+            else content
+            for content in v
+        ]
+
     @property
     def influence(self) -> float:
         return float(self.get_setting(INTENSITY_FIELD_ALIAS, INTENSITY_FIELD_DEFAULT))
@@ -37,5 +49,22 @@ class ControlValue(OptionValue):
     ) -> Any:
         return self.settings.get(key, default)
 
+    def get_content(self, content_type: ContentType) -> Content:
+        """Returns the first input content of the given type."""
+        for content in self.input_contents:
+            if content.type == content_type:
+                return content
+
+        available = [content.type for content in self.input_contents]
+
+        raise ContentNotFoundException(
+            f"{content_type} content is required in the {self.type} control. Available contents: {available}"
+        )
+
+    def to_pil_image(
+        self, content_type: ContentType = ContentType.IMAGE
+    ) -> Image.Image:
+        return self.get_content(content_type).to_pil_image()
+
 
 ReservedFieldValue = List[ControlValue]
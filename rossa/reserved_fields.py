@@ -1,3 +1,4 @@
+from functools import wraps
 from typing import List, Optional, Union
 from pydantic import BaseModel
 from .constants import (
@@ -90,6 +91,26 @@ class ControlOption(Option):
         return self.supports_content(ContentType.MASK)
 
 
+def _reuse_default_field(field_fn):
+    """Returns one shared FieldInfo when a reserved field is declared without arguments."""
+    default_field = None
+
+    @wraps(field_fn)
+    def wrapper(*args, **kwargs):
+        nonlocal default_field
+
+        if args or kwargs:
+            return field_fn(*args, **kwargs)
+
+        if default_field is None:
+            default_field = field_fn()
+
+        return default_field
+
+    return wrapper
+
+
+@_reuse_default_field
 def PromptField(
     title: str = "Prompt",
     description: str = "Prompt for the model.",
@@ -117,6 +138,7 @@ def PromptField(
     )
 
 
+@_reuse_default_field
 def NegativePromptField(
     title: str = "Negative Prompt",
     description: str = "Negative prompt for the model.",
@@ -176,6 +198,7 @@ def ControlsField(
     )
 
 
+@_reuse_default_field
 def IntensityField(
     alias=INTENSITY_FIELD_ALIAS,
     title="Intensity",
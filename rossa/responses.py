@@ -3,6 +3,7 @@ from pydantic import BaseModel, Field
 from fastapi import Response as FastAPIResponse
 from .types import ContentType, ProgressNotificationType
 from .contents import Content
+from .json_utils import json_dumps, json_loads
 
 
 class Response(Content):
@@ -35,6 +36,10 @@ class Notification(BaseModel):
     progress: float = Field(ge=0, le=1, description="Progress value between 0 and 1")
     message: str = Field(default=None, description="Optional progress message")
 
+    class Config:
+        json_dumps = json_dumps
+        json_loads = json_loads
+
 
 class ProgressNotification(Notification):
     type: ProgressNotificationType = ProgressNotificationType.PROGRESS
@@ -103,6 +103,7 @@ class GeneratorType(str, Enum):
         if self == GeneratorType.RANDOM_INTEGER:
             return random.randint(ge or 0, le or MAX_SAFE_INTEGER)
         elif self == GeneratorType.RANDOM_DECIMAL:
-            return random.randint(
-                ge or 0.0, le or MAX_SAFE_DECIMAL
-            )  # Adjust range as needed
+            return random.uniform(
+                ge if ge is not None else 0.0,
+                le if le is not None else MAX_SAFE_DECIMAL,
+            )
@@ -1,4 +1,4 @@
-from typing import List, Union
+from typing import Dict, List, Union
 
 from .reserved_fields import ControlOption
 
@@ -9,22 +9,38 @@ from .types import ControlType
 from .exceptions import ControlNotFoundException
 
 
+def index_controls(controls: List[ControlValue]) -> Dict[str, ControlValue]:
+    """Indexes controls by type, keeping the first control of each type like `next_control`."""
+    index = {}
+
+    for c in controls:
+        index.setdefault(c.type, c)
+
+    return index
+
+
 def next_control(
-    controls: List[ControlValue], control: Union[ControlOption, ControlType, str]
+    controls: Union[List[ControlValue], Dict[str, ControlValue]],
+    control: Union[ControlOption, ControlType, str],
 ) -> ControlValue:
+    """Returns the first control of the given type.
+
+    Pass the result of `index_controls` instead of the list when resolving several
+    controls from the same request, so each lookup is a single dict access.
+    """
     control_type = control.value if isinstance(control, ControlOption) else control
 
-    value = next(
-        filter(
-            lambda c: (c.control_type == control_type),
-            controls,
-        ),
-        None,
-    )
+    if isinstance(controls, dict):
+        value = controls.get(control_type)
+    else:
+        value = next((c for c in controls if c.type == control_type), None)
 
     if value is None:
+        title = control.title if isinstance(control, ControlOption) else control_type
+        available = list(controls) if isinstance(controls, dict) else [c.type for c in controls]
+
         raise ControlNotFoundException(
-            f"{control.title} ({control.value}) control is required. Available controls: {[c.control_type for c in controls]}"
+            f"{title} ({control_type}) control is required. Available controls: {available}"
         )
 
     return value
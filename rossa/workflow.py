@@ -5,9 +5,6 @@ from .workflow_blueprint import WorkflowBlueprint
 
 from .format_utils import clean_and_format_string
 
-from .adapters.local import LocalWorkflowAdapter
-from .adapters.modal import ModalWorkflowAdapter
-
 from .responses import Notification, Response
 
 
@@ -75,6 +72,9 @@ class BaseWorkflow(WorkflowBlueprint):
             self.schema()["title"]
         )
 
+        # Imported on use, code generation isn't needed by workflows at runtime
+        from .adapters.modal import ModalWorkflowAdapter
+
         adapter = ModalWorkflowAdapter()
 
         return adapter.convert_workflow(
@@ -93,6 +93,8 @@ class BaseWorkflow(WorkflowBlueprint):
         custom_class_code: str = None,
         include_class_code: bool = True,
     ) -> str:
+        from .adapters.local import LocalWorkflowAdapter
+
         adapter = LocalWorkflowAdapter()
 
         return adapter.convert_workflow(
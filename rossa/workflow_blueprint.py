@@ -1,22 +1,110 @@
-from typing import Any, Dict, Generator, List, Optional, Union
+from typing import Any, Dict, Generator, List, Optional, Tuple, Union
 
 from .constants import SAFE_DEFAULT_FIELD_KEY, REAL_DEFAULT_FIELD_KEY
 from .responses import Notification, Response
 from .image import Image
-from .fields import FieldType, Option
+from .json_utils import json_dumps
+from .fields import FIELD_TYPES, Option
 from abc import ABC, abstractmethod
-from pydantic import Extra, validate_arguments, BaseModel
+from pydantic import Extra, BaseModel
+from pydantic.decorator import ValidatedFunction
 from pydantic.fields import FieldInfo
+import copy
 import inspect
 from typing import Optional
 
 
+# Pydantic v1 keeps the extra field kwargs in `extra`, v2 in `json_schema_extra`
+_EXTRA_ATTR = "extra" if hasattr(FieldInfo, "extra") else "json_schema_extra"
+
+OPTIONS_KEY = "options"
+TYPE_KEY = "type"
+
+# Schema values that are returned unchanged, matched by exact type
+_PLAIN_VALUE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
 ReturnResults = Union[
     Union[Response, Notification],
     List[Union[Response, Notification]],
 ]
 
 
+def get_field_params(
+    signature: inspect.Signature,
+) -> Tuple[Tuple[str, FieldInfo], ...]:
+    """Returns the (name, FieldInfo) pairs of the parameters declared with a field."""
+    return tuple(
+        (name, param.default)
+        for name, param in signature.parameters.items()
+        if isinstance(param.default, FieldInfo)
+    )
+
+
+def process_value(value: Any) -> Any:
+    """Converts a value found in a field to plain data for the schema."""
+    # Most leaves are plain scalars, settle them with one type probe
+    if type(value) in _PLAIN_VALUE_TYPES:
+        return value
+    elif isinstance(value, FieldInfo):
+        return field_info_to_dict(value)
+    elif isinstance(value, list):
+        return [process_value(item) for item in value]
+    elif isinstance(value, dict):
+        return {k: process_value(v) for k, v in value.items()}
+    elif isinstance(value, BaseModel):
+        # Same keys as .dict(), read straight from the attributes in a single pass
+        # instead of .dict()'s copy followed by another walk
+        return {key: process_value(getattr(value, key)) for key in value.__fields__}
+    return value
+
+
+def field_info_to_dict(field: FieldInfo, name: Optional[str] = None) -> Dict[str, Any]:
+    """Converts a field declared with one of the rossa fields to its schema dict."""
+    if not isinstance(field, FieldInfo):
+        raise ValueError("Field must be a FieldInfo")
+
+    # Work on a copy, field infos can be shared between signatures
+    extra = dict(getattr(field, _EXTRA_ATTR, None) or {})
+
+    # A missing type reads as None, which is never in FIELD_TYPES
+    if extra.get(TYPE_KEY) not in FIELD_TYPES:
+        raise ValueError("Field type must be in FieldType.")
+
+    name = name or field.alias
+
+    if not name or not isinstance(name, str):
+        raise ValueError("Field name must be a string")
+
+    options = []
+
+    # Take the options out of the copied extra in one lookup
+    field_options = extra.pop(OPTIONS_KEY, None)
+
+    if isinstance(field_options, list):
+        for option in field_options:
+            if not isinstance(option, Option):
+                continue
+
+            options.append(process_value(option))
+
+    if SAFE_DEFAULT_FIELD_KEY in extra:
+        extra[REAL_DEFAULT_FIELD_KEY] = extra.pop(SAFE_DEFAULT_FIELD_KEY)
+
+    # detele all values with None in the extra dict; every other value goes
+    # through process_value, so models nested in lists or dicts (e.g. a list
+    # of conditionals in show_if) become plain data like the options do.
+    extra = {k: process_value(v) for k, v in extra.items() if v is not None}
+
+    return {
+        "name": name,
+        "title": field.title,
+        "description": field.description,
+        OPTIONS_KEY: options,
+        **extra,
+    }
+
+
 class WorkflowBlueprint(ABC):
     image: Optional[Image] = None
     title: str
@@ -30,139 +118,119 @@ class WorkflowBlueprint(ABC):
         # Get the original signature of the cls.run method
         cls.original_run = cls.run
         original_signature = inspect.signature(cls.original_run)
-
-        # Apply the validate_arguments decorator to the original run method
-        validated_run = validate_arguments(
+        # Kept on the class so schema generation doesn't introspect run again
+        cls.run_signature = original_signature
+        param_names = frozenset(original_signature.parameters)
+        # (name, FieldInfo) pairs of the run parameters that make up the schema
+        cls.run_field_params = get_field_params(original_signature)
+
+        # Build the arguments model once per class (what validate_arguments does
+        # internally) and call it directly, skipping the decorator's wrapper frame
+        run_validator = ValidatedFunction(
             cls.original_run, config=dict(extra=Extra.ignore)
         )
+        cls.run_validator = run_validator
+
+        # Without annotations or field defaults the arguments model only contains
+        # Any fields, so validating would just copy the arguments around
+        original_run = cls.original_run
+        needs_validation = bool(cls.run_field_params) or any(
+            param.annotation is not inspect.Parameter.empty
+            for param in original_signature.parameters.values()
+        )
 
         # Ignore extra arguments
         def run_wrapper(self, *args, **kwargs):
-            # Extract only the arguments present in the original signature
-            valid_kwargs = {
-                k: v for k, v in kwargs.items() if k in original_signature.parameters
-            }
+            # Extract only the arguments present in the original signature; the
+            # set intersection only walks the smaller of the two. The common case
+            # passes no extras, and then kwargs can be used as is.
+            if kwargs.keys() <= param_names:
+                valid_kwargs = kwargs
+            else:
+                valid_kwargs = {k: kwargs[k] for k in kwargs.keys() & param_names}
+
+            if not needs_validation:
+                return original_run(self, *args, **valid_kwargs)
+
+            return run_validator.call(self, *args, **valid_kwargs)
 
-            return validated_run(self, *args, **valid_kwargs)
+        # Same argument handling as run, but builds the model with construct(),
+        # skipping validation. Only for inputs that were already validated.
+        def run_trusted(self, *args, **kwargs):
+            valid_kwargs = {k: kwargs[k] for k in kwargs.keys() & param_names}
+
+            values = run_validator.build_values((self, *args), valid_kwargs)
+
+            return run_validator.execute(run_validator.model.construct(**values))
 
         cls.run = run_wrapper
+        cls.run_trusted = run_trusted
 
-    def schema(self) -> Dict[str, Any]:
-        # validate title, version, description
-        if not isinstance(self.title, str):
-            raise ValueError("title must be a string")
-        if not isinstance(self.version, str):
-            raise ValueError("version must be a string")
-        if not isinstance(self.description, str):
-            raise ValueError("description must be a string")
+    @classmethod
+    def schema_fields(cls) -> List[Dict[str, Any]]:
+        """Returns the schema of every `run` field.
 
-        fields = []
+        The fields are built once per workflow class; each call returns a deep copy,
+        so callers can mutate the result without affecting later calls.
+        """
+        # Look in the class's own __dict__ so subclasses don't reuse a parent's fields
+        fields = cls.__dict__.get("_schema_fields")
 
+        if fields is None:
+            fields = cls._build_schema_fields()
+            cls._schema_fields = fields
+
+        return copy.deepcopy(fields)
+
+    @classmethod
+    def _build_schema_fields(cls) -> List[Dict[str, Any]]:
         # check if original_run is in the class and if it is a function
         # else use the run method
         run_fn = (
-            self.original_run
-            if hasattr(self, "original_run") and callable(self.original_run)
-            else self.run
+            cls.original_run
+            if hasattr(cls, "original_run") and callable(cls.original_run)
+            else cls.run
         )
 
-        parameters = inspect.signature(run_fn).parameters
-
-        def field_info_to_dict(
-            field: FieldInfo, name: Optional[str] = None
-        ) -> Dict[str, Any]:
-            if not isinstance(field, FieldInfo):
-                raise ValueError("Field must be a FieldInfo")
-
-            OPTIONS_KEY = "options"
-            TYPE_KEY = "type"
-
-            extra = (
-                field.extra
-                if hasattr(field, "extra")
-                else (
-                    field.json_schema_extra
-                    if hasattr(field, "json_schema_extra")
-                    else {}
-                )
-            )
-
-            if TYPE_KEY not in extra or extra[TYPE_KEY] not in set(FieldType):
-                raise ValueError("Field type must be in FieldType.")
-
-            name = name or field.alias
-
-            if not name or not isinstance(name, str):
-                raise ValueError("Field name must be a string")
-
-            options = []
-
-            def process_value(value: Any) -> Any:
-                if isinstance(value, FieldInfo):
-                    return field_info_to_dict(value)
-                elif isinstance(value, list):
-                    return [process_value(item) for item in value]
-                elif isinstance(value, dict):
-                    return {k: process_value(v) for k, v in value.items()}
-                elif isinstance(value, BaseModel):
-                    return value.dict()
-                return value
-
-            if OPTIONS_KEY in extra and isinstance(extra[OPTIONS_KEY], list):
-                for option in extra[OPTIONS_KEY]:
-                    if not isinstance(option, Option):
-                        continue
-
-                    option_dict = option.dict()
-                    option_dict = {
-                        key: process_value(value) for key, value in option_dict.items()
-                    }
-                    options.append(option_dict)
-
-            if OPTIONS_KEY in extra:
-                del extra[OPTIONS_KEY]
-
-            if SAFE_DEFAULT_FIELD_KEY in extra:
-                extra[REAL_DEFAULT_FIELD_KEY] = extra[SAFE_DEFAULT_FIELD_KEY]
-                del extra[SAFE_DEFAULT_FIELD_KEY]
-
-            # detele all values with None in the extra dict
-            extra = {
-                k: v.dict() if isinstance(v, BaseModel) else v
-                for k, v in extra.items()
-                if v is not None
-            }
-
-            return {
-                "name": name,
-                "title": field.title,
-                "description": field.description,
-                OPTIONS_KEY: options,
-                **extra,
-            }
-
-        for name, param in parameters.items():
-            default = param.default
-
-            if default == inspect.Parameter.empty or not isinstance(default, FieldInfo):
-                continue
+        field_params = (
+            cls.run_field_params
+            if hasattr(cls, "run_field_params") and run_fn is cls.original_run
+            else get_field_params(inspect.signature(run_fn))
+        )
 
-            field = field_info_to_dict(default, name)
+        if not field_params:
+            return []
 
-            if field is None:
-                continue
+        return [field_info_to_dict(default, name) for name, default in field_params]
 
-            fields.append(field)
+    def schema(self) -> Dict[str, Any]:
+        """Returns the workflow schema.
+
+        Only the field conversion is cached, per class. Title, version, description
+        and examples are read on every call, and the result shares no mutable state
+        with the workflow or with other calls.
+        """
+        # validate title, version, description
+        if not isinstance(self.title, str):
+            raise ValueError("title must be a string")
+        if not isinstance(self.version, str):
+            raise ValueError("version must be a string")
+        if not isinstance(self.description, str):
+            raise ValueError("description must be a string")
 
-        new_schema = {
+        return {
             "title": self.title,
             "version": self.version,
             "description": self.description,
-            "examples": self.examples if isinstance(self.examples, list) else [],
-            "fields": fields,
+            "examples": (
+                copy.deepcopy(self.examples) if isinstance(self.examples, list) else []
+            ),
+            "fields": self.schema_fields(),
         }
 
-        return new_schema
+    def schema_json(self) -> str:
+        """Returns `schema()` serialized as JSON, using orjson when it is installed."""
+        return json_dumps(self.schema())
 
     def download(self):
         pass
@@ -0,0 +1,28 @@
+from io import BytesIO
+
+import numpy as np
+from PIL import Image
+from rossa import Content, ContentType
+from rossa.base64_utils import parse_data_url
+
+
+contents = [
+    Content(type=ContentType.IMAGE, content=np.full((2, 2, 3), i, dtype=np.uint8))
+    for i in range(4)
+]
+
+
+urls = Content.batch_to_base64(contents)
+
+assert urls == [
+    content.to_base64() for content in contents
+], "batch_to_base64 should match to_base64 for each content."
+
+for i, url in enumerate(urls):
+    _, data = parse_data_url(url)
+
+    assert (
+        np.asarray(Image.open(BytesIO(data)))[0, 0, 0] == i
+    ), "batch_to_base64 should keep the order of the contents."
+
+print("Successfully encoded a batch of contents to base64.")
@@ -0,0 +1,43 @@
+import copy
+import pickle
+
+import numpy as np
+from rossa import Content, ContentType
+
+
+array = np.arange(4 * 3 * 3, dtype=np.uint8).reshape(4, 3, 3)
+
+content = Content(type=ContentType.IMAGE, content=array)
+
+
+encoded = content.encode_image("PNG")
+
+assert isinstance(encoded, bytes), "encode_image should return bytes."
+assert (
+    content.encode_image("png") is encoded
+), "encode_image should reuse the cached bytes for the same format."
+
+content.content = array.copy()
+
+assert (
+    content.encode_image("PNG") is not encoded
+), "Reassigning content should invalidate the cache."
+
+
+# Encoded contents are cached, and must still survive pickling and copies
+restored = pickle.loads(pickle.dumps(content))
+
+assert np.array_equal(restored.content, array), "Encoded contents should pickle."
+assert restored._encoded == {}, "The encode cache should not be pickled."
+assert (
+    restored.encode_image("PNG") == encoded
+), "An unpickled content should encode again."
+
+assert np.array_equal(
+    copy.deepcopy(content).content, array
+), "Encoded contents should deep copy."
+assert np.array_equal(
+    content.copy(deep=True).content, array
+), "Encoded contents should copy."
+
+print("Successfully cached encoded contents.")
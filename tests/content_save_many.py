@@ -0,0 +1,31 @@
+import os
+import tempfile
+
+import numpy as np
+from PIL import Image
+from rossa import Content, ContentType
+
+
+contents = [
+    Content(type=ContentType.IMAGE, content=np.full((2, 2, 3), i, dtype=np.uint8))
+    for i in range(4)
+]
+
+
+with tempfile.TemporaryDirectory() as temp_dir:
+    file_paths = [os.path.join(temp_dir, f"{i}.png") for i in range(len(contents))]
+
+    Content.save_many(contents, file_paths)
+
+    for i, file_path in enumerate(file_paths):
+        assert (
+            np.asarray(Image.open(file_path))[0, 0, 0] == i
+        ), "save_many should save each content to its own path."
+
+    try:
+        Content.save_many(contents, file_paths[:1])
+        raise AssertionError("Mismatched contents and paths should raise.")
+    except ValueError as e:
+        print(f"Successfully caught save_many exception: {e}")
+
+print("Successfully saved many contents.")
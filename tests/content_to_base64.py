@@ -0,0 +1,42 @@
+from io import BytesIO
+
+import numpy as np
+from PIL import Image
+from rossa import Content, ContentType
+from rossa.base64_utils import parse_data_url
+
+
+array = np.arange(4 * 3 * 3, dtype=np.uint8).reshape(4, 3, 3)
+
+content = Content(type=ContentType.IMAGE, content=array)
+
+
+# RAW data URLs carry the shape and dtype needed to rebuild the array
+raw_url = content.to_base64("RAW")
+media_type, data = parse_data_url(raw_url)
+header = raw_url[: raw_url.index(",")]
+params = dict(part.split("=") for part in header.split(";")[1:-1])
+shape = tuple(int(dim) for dim in params["shape"].split("x"))
+
+assert media_type == "application/octet-stream", "RAW data URL has the wrong type."
+assert np.array_equal(
+    np.frombuffer(data, dtype=params["dtype"]).reshape(shape), array
+), "RAW data URL should round trip the array."
+
+
+png_url = content.to_base64("PNG")
+media_type, data = parse_data_url(png_url)
+
+assert media_type == "image/png", "PNG data URL has the wrong type."
+assert np.array_equal(
+    np.asarray(Image.open(BytesIO(data))), array
+), "PNG data URL should round trip the image."
+
+
+try:
+    content.to_base64("NOT_A_FORMAT")
+    raise AssertionError("An unknown image format should raise.")
+except ValueError as e:
+    print(f"Successfully caught unknown format exception: {e}")
+
+print("Successfully encoded contents to base64 data URLs.")
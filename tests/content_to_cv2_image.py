@@ -0,0 +1,22 @@
+import numpy as np
+from rossa import Content, ContentType
+
+
+array = np.arange(4 * 3 * 3, dtype=np.uint8).reshape(4, 3, 3)
+
+png_bytes = Content(type=ContentType.IMAGE, content=array).encode_image("PNG")
+
+
+cv2_image = Content(type=ContentType.IMAGE, content=png_bytes).to_cv2_image()
+
+assert np.array_equal(
+    cv2_image[:, :, ::-1], array
+), "to_cv2_image should decode image bytes to a BGR array."
+
+try:
+    Content(type=ContentType.IMAGE, content=b"\xff not an image").to_cv2_image()
+    raise AssertionError("Invalid image bytes should raise.")
+except Exception as e:
+    print(f"Successfully caught invalid image bytes exception: {e}")
+
+print("Successfully decoded bytes contents with to_cv2_image.")
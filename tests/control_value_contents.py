@@ -0,0 +1,47 @@
+import base64
+from io import BytesIO
+
+from PIL import Image
+from rossa import ContentNotFoundException, ContentType, ControlValue
+
+
+def to_data_url(image: Image.Image) -> str:
+    buffered = BytesIO()
+    image.save(buffered, format="PNG")
+    return "data:image/png;base64," + base64.b64encode(buffered.getvalue()).decode()
+
+
+control = ControlValue(
+    type="inpainting",
+    input_contents=[
+        {"type": "image", "content": to_data_url(Image.new("RGB", (8, 6), "red"))},
+        {"type": "mask", "content": to_data_url(Image.new("L", (8, 6), 255))},
+    ],
+)
+
+image = control.to_pil_image(ContentType.IMAGE)
+mask = control.to_pil_image(ContentType.MASK)
+
+assert image.size == (8, 6) and image.mode == "RGB", "Image content not resolved."
+assert mask.size == (8, 6) and mask.mode == "L", "Mask content not resolved."
+
+assert (
+    control.get_content(ContentType.MASK).type == ContentType.MASK
+), "get_content should return the content of the requested type."
+
+try:
+    control.get_content(ContentType.VIDEO)
+    raise AssertionError("A missing content type should raise.")
+except ContentNotFoundException as e:
+    print(f"Successfully caught missing content exception: {e}")
+
+legacy_control = ControlValue(
+    type="inpainting",
+    input_contents=[to_data_url(Image.new("RGB", (4, 2), "blue"))],
+)
+
+assert (
+    legacy_control.to_pil_image().size == (4, 2)
+), "Bare string input contents should still be accepted as images."
+
+print("Successfully resolved control contents by type.")
@@ -0,0 +1,43 @@
+from rossa import (
+    ControlNotFoundException,
+    ControlOption,
+    ControlValue,
+    index_controls,
+    next_control,
+)
+
+
+class InputControl(ControlOption):
+    value: str = "input"
+    title: str = "Input"
+
+
+controls = [
+    ControlValue(type="input"),
+    ControlValue(type="mask"),
+    ControlValue(type="input"),
+]
+
+
+index = index_controls(controls)
+
+assert list(index) == ["input", "mask"], "index_controls should key controls by type."
+assert index["input"] is controls[0], "index_controls should keep the first control."
+
+
+for lookup in (controls, index):
+    assert (
+        next_control(lookup, InputControl()) is controls[0]
+    ), "next_control should return the first control of the option's type."
+
+    assert (
+        next_control(lookup, "mask") is controls[1]
+    ), "next_control should accept a control type string."
+
+    try:
+        next_control(lookup, "depth")
+        raise AssertionError("A missing control should raise.")
+    except ControlNotFoundException as e:
+        print(f"Successfully caught missing control exception: {e}")
+
+print("Successfully looked up controls from a list and an index.")
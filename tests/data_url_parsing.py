@@ -0,0 +1,15 @@
+from rossa.base64_utils import parse_data_url
+
+
+media_type, data = parse_data_url("data:text/plain;base64,aGVsbG8=")
+
+assert media_type == "text/plain", "parse_data_url should return the media type."
+assert data == b"hello", "parse_data_url should decode the payload."
+
+try:
+    parse_data_url("data:image/png;base64")
+    raise AssertionError("A data URL without a payload should raise.")
+except ValueError as e:
+    print(f"Successfully caught invalid data URL exception: {e}")
+
+print("Successfully parsed data URLs.")
@@ -0,0 +1,57 @@
+from typing import List
+from rossa import BaseWorkflow, ControlOption, ControlValue, ControlsField
+
+
+class InputControl(ControlOption):
+    value: str = "input"
+    title: str = "Input"
+
+
+class Workflow(BaseWorkflow):
+    def run(
+        self,
+        controls: List[ControlValue] = ControlsField(options=[InputControl()]),
+        strength: float = 0.5,
+    ):
+        return controls, strength
+
+
+workflow = Workflow()
+
+
+controls, strength = workflow.run(
+    controls=[{"type": "input"}],
+    strength="0.25",
+    prompt="Extra kwargs must be ignored.",
+)
+
+assert all(
+    isinstance(control, ControlValue) for control in controls
+), "run should validate controls into ControlValue."
+assert strength == 0.25, "run should validate strength into a float."
+
+
+trusted_controls = [ControlValue(type="input")]
+
+controls, strength = workflow.run_trusted(
+    controls=trusted_controls,
+    strength=0.75,
+    prompt="Extra kwargs must be ignored.",
+)
+
+assert (
+    controls is trusted_controls
+), "run_trusted should pass validated arguments through untouched."
+assert strength == 0.75, "run_trusted should pass strength through."
+
+
+_, strength = workflow.run_trusted(controls=trusted_controls, strength="0.75")
+
+assert strength == "0.75", "run_trusted must not validate or convert arguments."
+
+
+controls, strength = workflow.run_trusted()
+
+assert controls == [] and strength == 0.5, "run_trusted should apply the defaults."
+
+print("Successfully ran workflow with trusted arguments.")
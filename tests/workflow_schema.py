@@ -10,4 +10,8 @@ assert (
     len(schema["fields"]) > 0
 ), "Schema fields should not be empty. Check if run method has ControlsField or BaseWorkflow is extracting the cls.run's parameters correctly."
 
+assert (
+    workflow.schema() == schema
+), "Schema should be the same across calls. Check if schema() is mutating the fields."
+
 print("Sucessfully extracted schema from workflow.")
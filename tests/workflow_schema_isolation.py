@@ -0,0 +1,60 @@
+from rossa import BaseWorkflow, IfValue, TextField
+
+
+class Workflow(BaseWorkflow):
+    title = "Schema Isolation"
+    version = "V1"
+    description = "Returned schemas must not share state."
+
+    examples = [{"title": "Example", "data": {"prompt": "a chair"}}]
+
+    def run(
+        self,
+        prompt: str = TextField(
+            title="Prompt",
+            description="Prompt.",
+            show_if=[IfValue(field="mode", value="advanced")],
+        ),
+    ):
+        return prompt
+
+
+workflow = Workflow()
+
+
+schema = workflow.schema()
+
+schema["title"] = "Mutated"
+schema["fields"][0]["title"] = "Mutated"
+schema["fields"][0]["show_if"][0]["value"] = "Mutated"
+schema["examples"][0]["data"]["prompt"] = "Mutated"
+schema["examples"].append({"title": "Mutated"})
+
+fresh_schema = workflow.schema()
+
+assert fresh_schema["title"] == "Schema Isolation", "Title leaked between calls."
+assert (
+    fresh_schema["fields"][0]["title"] == "Prompt"
+), "Mutating a returned schema should not leak into the next call's fields."
+assert (
+    fresh_schema["fields"][0]["show_if"][0]["value"] == "advanced"
+), "Nested field values should not be shared between calls."
+assert (
+    fresh_schema["examples"] == Workflow.examples
+    and Workflow.examples[0]["data"]["prompt"] == "a chair"
+), "Mutating a returned schema should not leak into the workflow's examples."
+
+
+workflow.examples = []
+
+assert (
+    workflow.schema()["examples"] == []
+), "Schema should reflect the workflow's current examples."
+
+workflow.description = "Changed."
+
+assert (
+    workflow.schema()["description"] == "Changed."
+), "Schema should reflect the workflow's current description."
+
+print("Successfully built isolated schemas.")
@@ -0,0 +1,46 @@
+import json
+from rossa import BaseWorkflow, IfMinLength, IfNotValue, IfValue, TextField
+
+
+class Workflow(BaseWorkflow):
+    title = "Conditional Fields"
+    version = "V1"
+    description = "Fields shown and disabled by lists of conditionals."
+
+    def run(
+        self,
+        mode: str = TextField(title="Mode", description="Mode.", default="basic"),
+        detail: str = TextField(
+            title="Detail",
+            description="Detail.",
+            show_if=[IfValue(field="mode", value="advanced")],
+            disable_if=[
+                IfNotValue(field="mode", value="advanced"),
+                IfMinLength(field="mode", min_length=20),
+            ],
+        ),
+    ):
+        return mode, detail
+
+
+workflow = Workflow()
+
+
+schema = json.loads(workflow.schema_json())
+
+fields = {field["name"]: field for field in schema["fields"]}
+
+assert fields["detail"]["show_if"] == [
+    {"type": "if_value", "field": "mode", "value": "advanced"}
+], "List-valued show_if should be serialized as a list of dicts."
+
+assert fields["detail"]["disable_if"] == [
+    {"type": "if_not_value", "field": "mode", "value": "advanced"},
+    {"type": "if_min_length", "field": "mode", "min_length": 20},
+], "List-valued disable_if should be serialized as a list of dicts."
+
+assert (
+    "show_if" not in fields["mode"]
+), "Conditionals left as None should be dropped from the schema."
+
+print("Successfully serialized a schema with list-valued conditionals.")
@@ -24,6 +24,14 @@ image = (
 
 with image.imports():
     from simple_lama_inpainting import SimpleLama
+    from simple_lama_inpainting.models.model import LAMA_MODEL_URL
+    from simple_lama_inpainting.utils.util import download_model
+
+
+def convert_mode(image, mode: str):
+    """Like `image.convert(mode)`, without the full copy convert makes when the image
+    already has that mode."""
+    return image if image.mode == mode else image.convert(mode)
 
 
 class InpaintingImageControl(ControlOption):
@@ -35,6 +43,10 @@ class InpaintingImageControl(ControlOption):
     ]
 
 
+# Built once, run() only needs it to look the control up
+INPAINTING_CONTROL = InpaintingImageControl()
+
+
 class Workflow(BaseWorkflow):
     image = image
     title = "Object Remover"
@@ -65,9 +77,14 @@ class Workflow(BaseWorkflow):
     ]
 
     def download(self):
-        self.simple_lama = SimpleLama()
+        # Only fetch the checkpoint into the torch hub cache, load() builds the model
+        download_model(LAMA_MODEL_URL)
 
     def load(self):
+        # The adapters may call load() again on a warm container, keep the model
+        if getattr(self, "simple_lama", None) is not None:
+            return
+
         self.simple_lama = SimpleLama()
 
     def run(
@@ -83,12 +100,15 @@ class Workflow(BaseWorkflow):
             ]
         ),
     ):
-        image = next_control(controls, InpaintingImageControl())
+        control = next_control(controls, INPAINTING_CONTROL)
 
-        image = image.to_pil_image(ContentType.IMAGE).convert("RGB")
+        # Both come from the control; the mask used to be read from the decoded image
+        image = convert_mode(control.to_pil_image(ContentType.IMAGE), "RGB")
 
-        mask = image.to_pil_image(ContentType.MASK).convert("L")
+        mask = convert_mode(control.to_pil_image(ContentType.MASK), "L")
 
+        # No fp16 autocast here: LaMa's Fourier units run rfftn/irfftn, which autocast
+        # does not keep in fp32, and fp16 cuFFT only handles power of two sizes
         result = self.simple_lama(image, mask)
 
         yield ImageResponse(content=result)